@@ -2,44 +2,61 @@
 EMR系统 Python API使用示例
 """
 
-import requests
-import json
+import httpx
+import orjson
+import os
 from typing import Optional, Dict, Any
 
 class EMRClient:
     def __init__(self, base_url: str = 'http://localhost:3000/api/v1'):
         self.base_url = base_url
         self.token: Optional[str] = None
-        self.session = requests.Session()
+        # HTTP/2 复用单个连接并行处理请求，显著降低批量调用的延迟；
+        # 加大连接池以支撑并发上传，连接失败时由transport自动重试
+        self.session = httpx.Client(
+            base_url=base_url,
+            timeout=30.0,
+            transport=httpx.HTTPTransport(
+                http2=True,
+                retries=3,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+            )
+        )
 
     def set_token(self, token: str):
         """设置认证令牌"""
         self.token = token
         self.session.headers.update({'Authorization': f'Bearer {token}'})
 
-    def request(self, endpoint: str, method: str = 'GET', 
-                data: Optional[Dict] = None, files: Optional[Dict] = None) -> Dict[Any, Any]:
+    def request(self, endpoint: str, method: str = 'GET',
+                data: Optional[Dict] = None, files: Optional[Dict] = None,
+                params: Optional[Dict] = None) -> Dict[Any, Any]:
         """通用请求方法"""
-        url = f"{self.base_url}{endpoint}"
-        
         headers = {}
+        content = None
         if data and not files:
+            # orjson直接生成bytes，大负载下比标准库json快3-5倍；
+            # 预编码的字节体要走content=，httpx已废弃用data=传原始bytes
             headers['Content-Type'] = 'application/json'
-            data = json.dumps(data)
+            content = orjson.dumps(data)
+            data = None
 
         response = self.session.request(
             method=method,
-            url=url,
+            url=endpoint,
+            content=content,
             data=data,
             files=files,
+            params=params,
             headers=headers
         )
 
-        if not response.ok:
-            error_data = response.json()
+        if not response.is_success:
+            error_data = orjson.loads(response.content)
             raise Exception(f"API Error: {error_data.get('message', 'Unknown error')}")
 
-        return response.json()
+        # 从原始bytes解码，跳过response.json()多做的一次文本解码
+        return orjson.loads(response.content)
 
     def register(self, user_data: Dict) -> Dict:
         """用户注册"""
@@ -57,45 +74,40 @@ class EMRClient:
 
     def get_records(self, **params) -> Dict:
         """获取病历列表"""
-        endpoint = '/records'
-        if params:
-            query_string = '&'.join([f"{k}={v}" for k, v in params.items()])
-            endpoint += f"?{query_string}"
-        
-        return self.request(endpoint)
+        # 交给httpx做URL编码，手工拼接既慢又不会转义特殊字符
+        return self.request('/records', method='GET', params=params)
 
     def upload_record(self, file_path: str, patient_id: str, title: str, 
                      record_type: str, department: str = '') -> Dict:
         """上传病历"""
         with open(file_path, 'rb') as file:
-            files = {'file': file}
+            # httpx按块读取文件对象，CT/MRI等大文件不会整体载入内存
+            files = {'file': (os.path.basename(file_path), file, 'application/octet-stream')}
             data = {
                 'patientId': patient_id,
                 'title': title,
                 'recordType': record_type,
                 'department': department
             }
-            
-            # 对于文件上传，我们需要直接使用requests
-            url = f"{self.base_url}/records"
-            response = self.session.post(url, data=data, files=files)
-            
-            if not response.ok:
-                error_data = response.json()
+
+            response = self.session.post('/records', data=data, files=files)
+
+            if not response.is_success:
+                error_data = orjson.loads(response.content)
                 raise Exception(f"Upload failed: {error_data.get('message')}")
-            
-            return response.json()
+
+            return orjson.loads(response.content)
 
     def download_record(self, record_id: str, save_path: str):
         """下载病历"""
-        url = f"{self.base_url}/records/{record_id}/download"
-        response = self.session.get(url)
-        
-        if not response.ok:
-            raise Exception("Download failed")
-        
-        with open(save_path, 'wb') as file:
-            file.write(response.content)
+        # 流式下载，按块写入文件，避免把整个响应缓存在内存中
+        with self.session.stream('GET', f'/records/{record_id}/download') as response:
+            if not response.is_success:
+                raise Exception("Download failed")
+
+            with open(save_path, 'wb') as file:
+                for chunk in response.iter_bytes(65536):
+                    file.write(chunk)
 
     def check_permission(self, record_id: str, action: str) -> Dict:
         """检查权限"""